@@ -22,6 +22,7 @@ import os
 import io
 import time
 import re
+import copy
 import types
 import zipfile
 import zipimport
@@ -124,6 +125,7 @@ class PEP440Warning(RuntimeWarning):
     """
 
 
+@functools.lru_cache(maxsize=1024)
 def parse_version(v):
     try:
         return packaging.version.Version(v)
@@ -1315,24 +1317,45 @@ def get_default_cache():
     )
 
 
+_UNSAFE_NAME_CHARS = re.compile('[^A-Za-z0-9.]+')
+_UNSAFE_EXTRA_CHARS = re.compile('[^A-Za-z0-9.-]+')
+
+
 def safe_name(name):
     """Convert an arbitrary string to a standard distribution name
 
     Any runs of non-alphanumeric/. characters are replaced with a single '-'.
     """
-    return re.sub('[^A-Za-z0-9.]+', '-', name)
+    return _UNSAFE_NAME_CHARS.sub('-', name)
+
+
+def _is_plain_release(version):
+    """
+    Is `version` a dotted run of integers (e.g. ``1.10.2``) that PEP 440
+    normalization would leave unchanged?
+    """
+    for part in version.split('.'):
+        if not part or part.strip('0123456789'):
+            return False
+        if len(part) > 1 and part[0] == '0':
+            # leading zeros are dropped when normalizing
+            return False
+    return True
 
 
 def safe_version(version):
     """
     Convert an arbitrary string to a standard version string
     """
+    if _is_plain_release(version):
+        # already normalized; skip the regex-based parse below
+        return version
     try:
         # normalize the version
         return str(packaging.version.Version(version))
     except packaging.version.InvalidVersion:
         version = version.replace(' ', '.')
-        return re.sub('[^A-Za-z0-9.]+', '-', version)
+        return _UNSAFE_NAME_CHARS.sub('-', version)
 
 
 def safe_extra(extra):
@@ -1341,7 +1364,7 @@ def safe_extra(extra):
     Any runs of non-alphanumeric characters are replaced with a single '_',
     and the result is always lowercased.
     """
-    return re.sub('[^A-Za-z0-9.-]+', '_', extra).lower()
+    return _UNSAFE_EXTRA_CHARS.sub('_', extra).lower()
 
 
 def to_filename(name):
@@ -2039,7 +2062,7 @@ def _by_version_descending(names):
         """
         name, ext = os.path.splitext(name)
         parts = itertools.chain(name.split('-'), [ext])
-        return [packaging.version.parse(part) for part in parts]
+        return [parse_version(part) for part in parts]
 
     return sorted(names, key=_by_version, reverse=True)
 
@@ -2241,16 +2264,16 @@ def _rebuild_mod_path(orig_path, package_name, module):
     Rebuild module.__path__ ensuring that all entries are ordered
     corresponding to their sys.path order
     """
-    sys_path = [_normalize_cached(p) for p in sys.path]
+    # map each normalized sys.path entry to its first position
+    sys_path_index = {}
+    for index, entry in enumerate(sys.path):
+        sys_path_index.setdefault(_normalize_cached(entry), index)
 
     def safe_sys_path_index(entry):
         """
         Workaround for #520 and #513.
         """
-        try:
-            return sys_path.index(entry)
-        except ValueError:
-            return float('inf')
+        return sys_path_index.get(entry, float('inf'))
 
     def position_in_sys_path(path):
         """
@@ -2403,8 +2426,7 @@ def yield_lines(strs):
                 yield s
     else:
         for ss in strs:
-            for s in yield_lines(ss):
-                yield s
+            yield from yield_lines(ss)
 
 
 MODULE = re.compile(r"\w+(\.\w+)*$").match
@@ -2422,6 +2444,18 @@ EGG_NAME = re.compile(
 ).match
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_egg_name(basename):
+    """
+    Return the (name, version, py_version, platform) parts of an egg
+    `basename` (without extension); parts that aren't present are ``None``.
+    """
+    match = EGG_NAME(basename)
+    if not match:
+        return (None,) * 4
+    return match.group('name', 'ver', 'pyver', 'plat')
+
+
 class EntryPoint:
     """Object representing an advertised importable object"""
 
@@ -2590,12 +2624,9 @@ class Distribution:
         basename, ext = os.path.splitext(basename)
         if ext.lower() in _distributionImpl:
             cls = _distributionImpl[ext.lower()]
-
-            match = EGG_NAME(basename)
-            if match:
-                project_name, version, py_version, platform = match.group(
-                    'name', 'ver', 'pyver', 'plat'
-                )
+            project_name, version, py_version, platform = _parse_egg_name(
+                basename
+            )
         return cls(
             location, metadata, project_name=project_name, version=version,
             py_version=py_version, platform=platform, **kw
@@ -2634,7 +2665,11 @@ class Distribution:
         if not isinstance(other, self.__class__):
             # It's not a Distribution, so they are not equal
             return False
-        return self.hashcmp == other.hashcmp
+        if self is other:
+            return True
+        # Compare the (interned) keys first, so distributions of different
+        # projects don't need their versions loaded just to tell them apart
+        return self.key == other.key and self.hashcmp == other.hashcmp
 
     def __ne__(self, other):
         return not self == other
@@ -2648,15 +2683,16 @@ class Distribution:
         try:
             return self._key
         except AttributeError:
-            self._key = key = self.project_name.lower()
+            self._key = key = sys.intern(self.project_name.lower())
             return key
 
     @property
     def parsed_version(self):
-        if not hasattr(self, "_parsed_version"):
-            self._parsed_version = parse_version(self.version)
-
-        return self._parsed_version
+        try:
+            return self._parsed_version
+        except AttributeError:
+            self._parsed_version = parsed = parse_version(self.version)
+            return parsed
 
     def _warn_legacy_version(self):
         LV = packaging.version.LegacyVersion
@@ -3100,7 +3136,15 @@ def parse_requirements(strs):
                 line += next(lines)
             except StopIteration:
                 return
-        yield Requirement(line)
+        # hand out a deep copy, so callers may alter it or its members (e.g.
+        # drop the marker or extend specs) without touching the cached one
+        yield copy.deepcopy(_parse_requirement_line(line))
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_requirement_line(line):
+    """Parse (and memoize) a single requirement line"""
+    return Requirement(line)
 
 
 class Requirement(packaging.requirements.Requirement):
@@ -3112,7 +3156,8 @@ class Requirement(packaging.requirements.Requirement):
             raise RequirementParseError(str(e))
         self.unsafe_name = self.name
         project_name = safe_name(self.name)
-        self.project_name, self.key = project_name, project_name.lower()
+        self.project_name = project_name
+        self.key = sys.intern(project_name.lower())
         self.specs = [
             (spec.operator, spec.version) for spec in self.specifier]
         self.extras = tuple(map(safe_extra, self.extras))
@@ -3128,6 +3173,7 @@ class Requirement(packaging.requirements.Requirement):
     def __eq__(self, other):
         return (
             isinstance(other, Requirement) and
+            self.__hash == other.__hash and
             self.hashCmp == other.hashCmp
         )
 
@@ -3139,7 +3185,9 @@ class Requirement(packaging.requirements.Requirement):
             if item.key != self.key:
                 return False
 
-            item = item.version
+            item = item.parsed_version
+        elif isinstance(item, six.string_types):
+            item = parse_version(item)
 
         # Allow prereleases always in order to match the previous behavior of
         # this method. In the future this should be smarter and follow PEP 440
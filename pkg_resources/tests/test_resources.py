@@ -97,6 +97,42 @@ class TestDistro:
         ws.add(foo14)
         assert ad.best_match(req, ws).version == '1.4'
 
+    def test_environment_add_keeps_order(self):
+        ad = pkg_resources.Environment([], platform=None, python=None)
+        for version in '1.1', '2.0', '1.5', '0.9', '1.5', '2.0':
+            ad.add(dist_from_fn("Foo-%s.egg" % version))
+        expected = ['2.0', '1.5', '1.1', '0.9']
+        assert [dist.version for dist in ad['foo']] == expected
+        ad.remove(ad['foo'][1])
+        ad.add(dist_from_fn("Foo-1.2.egg"))
+        expected = ['2.0', '1.2', '1.1', '0.9']
+        assert [dist.version for dist in ad['foo']] == expected
+
+    def test_environment_add_after_dist_changed(self):
+        """
+        Entries altered after being added are ordered and de-duplicated
+        by their current state.
+        """
+        ad = pkg_resources.Environment([], platform=None, python=None)
+        ad.add(dist_from_fn("Foo-1.0.egg"))
+        foo20 = dist_from_fn("Foo-2.0.egg")
+        ad.add(foo20)
+        # deliberately poke the private attributes: this mimics the in-place
+        # version patching done by setuptools (egg_info.finalize_options and
+        # Distribution.patch_missing_pkg_info in setuptools/dist.py)
+        foo20._version = '0.5'
+        del foo20._parsed_version
+        ad.add(dist_from_fn("Foo-1.5.egg"))
+        expected = ['1.5', '1.0', '0.5']
+        assert [dist.version for dist in ad['foo']] == expected
+
+        ad = pkg_resources.Environment([], platform=None, python=None)
+        bar = dist_from_fn("/old/Bar-1.0.egg")
+        ad.add(bar)
+        bar.location = "/new/Bar-1.0.egg"
+        ad.add(dist_from_fn("/new/Bar-1.0.egg"))
+        assert ad['bar'] == [bar]
+
     def checkFooPkg(self, d):
         assert d.project_name == "FooPkg"
         assert d.key == "foopkg"
@@ -119,6 +155,24 @@ class TestDistro:
         assert d.py_version == '{}.{}'.format(*sys.version_info)
         assert d.platform is None
 
+    def test_lookup_by_requirement_key(self):
+        dist = Distribution("/some/path", project_name="FooPkg", version="1.0")
+        req = Requirement.parse("fooPKG>=1.0")
+        assert dist.key == req.key
+        ws = WorkingSet([])
+        ws.add(dist)
+        assert ws.find(req) == dist
+        ad = pkg_resources.Environment([], platform=None, python=None)
+        ad.add(dist)
+        assert ad[req.key] == [dist]
+
+    def test_eq_other_project_does_not_need_version(self):
+        # neither distribution can find its version
+        foo = Distribution("/some/path", project_name="Foo")
+        bar = Distribution("/some/path", project_name="Bar")
+        assert foo != bar
+        assert foo == foo
+
     def testDistroParse(self):
         d = dist_from_fn("FooPkg-1.3.post1-py2.4-win32.egg")
         self.checkFooPkg(d)
@@ -568,19 +622,22 @@ class TestRequirements:
             ))
         )
 
-    def testVersionEquality(self):
-        r1 = Requirement.parse("foo==0.3a2")
-        r2 = Requirement.parse("foo!=0.3a4")
-        d = Distribution.from_filename
-
-        assert d("foo-0.3a4.egg") not in r1
-        assert d("foo-0.3a1.egg") not in r1
-        assert d("foo-0.3a4.egg") not in r2
-
-        assert d("foo-0.3a2.egg") in r1
-        assert d("foo-0.3a2.egg") in r2
-        assert d("foo-0.3a3.egg") in r2
-        assert d("foo-0.3a5.egg") in r2
+    @pytest.mark.parametrize(
+        ['spec', 'version', 'contained'],
+        [
+            ("foo==0.3a2", "0.3a4", False),
+            ("foo==0.3a2", "0.3a1", False),
+            ("foo!=0.3a4", "0.3a4", False),
+            ("foo==0.3a2", "0.3a2", True),
+            ("foo!=0.3a4", "0.3a2", True),
+            ("foo!=0.3a4", "0.3a3", True),
+            ("foo!=0.3a4", "0.3a5", True),
+        ],
+    )
+    def testVersionEquality(self, spec, version, contained):
+        req = Requirement.parse(spec)
+        dist = Distribution.from_filename("foo-%s.egg" % version)
+        assert (dist in req) == contained
 
     def testSetuptoolsProjectName(self):
         """
@@ -607,13 +664,18 @@ class TestRequirements:
 class TestParsing:
     def testEmptyParse(self):
         assert list(parse_requirements('')) == []
+        assert list(parse_requirements(' \n\t')) == []
+        assert list(parse_requirements([])) == []
 
-    def testYielding(self):
-        for inp, out in [
+    @pytest.mark.parametrize(
+        ['inp', 'out'],
+        [
             ([], []), ('x', ['x']), ([[]], []), (' x\n y', ['x', 'y']),
-            (['x\n\n', 'y'], ['x', 'y']),
-        ]:
-            assert list(pkg_resources.yield_lines(inp)) == out
+            (['x\n\n', 'y'], ['x', 'y']), ('x\n # y\nz', ['x', 'z']),
+        ],
+    )
+    def testYielding(self, inp, out):
+        assert list(pkg_resources.yield_lines(inp)) == out
 
     def testSplitting(self):
         sample = """
@@ -656,6 +718,10 @@ class TestParsing:
         assert safe_version("2.3.4 20050521") == "2.3.4.20050521"
         assert safe_version("Money$$$Maker") == "Money-Maker"
         assert safe_version("peak.web") == "peak.web"
+        assert safe_version("1.10.2") == "1.10.2"
+        assert safe_version("1.02") == "1.2"
+        assert safe_version("0.0") == "0.0"
+        assert safe_version("1..2") == "1..2"
 
     def testSimpleRequirements(self):
         assert (
@@ -706,6 +772,21 @@ class TestParsing:
             Requirement.parse("name[foo,bar]==1.0;python_version=='3.6'")
         )
 
+    def test_parsed_requirements_are_independent(self):
+        """
+        Altering a parsed requirement must not affect later parses of the
+        same string.
+        """
+        req, = parse_requirements("foo>=1.0;os_name=='a'")
+        req.marker = None
+        req.specs.append(('<', '2'))
+        req.specifier.prereleases = True
+        again, = parse_requirements("foo>=1.0;os_name=='a'")
+        assert again is not req
+        assert str(again.marker) == 'os_name == "a"'
+        assert again.specs == [('>=', '1.0')]
+        assert not again.specifier.prereleases
+
     def test_local_version(self):
         req, = parse_requirements('foo==1.0.org1')
 